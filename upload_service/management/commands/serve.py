@@ -0,0 +1,133 @@
+import math
+import os
+
+import uvicorn
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from uvicorn.supervisors import Multiprocess
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _read(path: str) -> str:
+    with open(path) as f:
+        return f.read().strip()
+
+
+def _cgroup_cpu_limit() -> int | None:
+    """
+    Cuota de CPU del contenedor (``docker --cpus``) redondeada hacia arriba.
+
+    Se lee ``cpu.max`` de cgroup v2 y, si no existe, los ficheros
+    ``cpu.cfs_quota_us``/``cpu.cfs_period_us`` de cgroup v1. Devuelve ``None``
+    si no hay cuota o no se puede leer.
+    """
+    try:
+        quota, period = _read(CGROUP_V2_CPU_MAX).split()
+        if quota == "max":
+            return None
+        return math.ceil(int(quota) / int(period))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        return None
+
+    try:
+        quota = int(_read(CGROUP_V1_CPU_QUOTA))
+        period = int(_read(CGROUP_V1_CPU_PERIOD))
+    except (OSError, ValueError):
+        return None
+    if quota <= 0 or period <= 0:  # -1 = sin cuota
+        return None
+    return math.ceil(quota / period)
+
+
+def default_worker_count() -> int:
+    """
+    Número de workers según los núcleos realmente disponibles.
+
+    ``os.process_cpu_count`` respeta la afinidad de CPU, pero no la cuota de
+    cgroups que aplica Docker con ``--cpus``; si existe una cuota se usa la
+    menor de las dos.
+    """
+    cpus = os.process_cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, limit)
+    return max(1, cpus)
+
+
+class DrainingMultiprocess(Multiprocess):
+    """
+    Supervisor de uvicorn que cierra el socket de escucha al recibir la señal
+    de parada.
+
+    El supervisor original mantiene el socket abierto hasta que terminan todos
+    los workers, de modo que durante el drenaje las conexiones nuevas se
+    quedan en el backlog sin atenderse. Al cerrarlo (los workers cierran su
+    copia al iniciar el apagado) el kernel las rechaza y el cliente o el
+    balanceador puede pasar a otra réplica.
+    """
+
+    def close_sockets(self) -> None:
+        for sock in self.sockets:
+            sock.close()
+
+    def handle_int(self) -> None:
+        self.close_sockets()
+        super().handle_int()
+
+    def handle_term(self) -> None:
+        self.close_sockets()
+        super().handle_term()
+
+
+class Command(BaseCommand):
+    help = (
+        "Inicia el servicio en modo producción con uvicorn y varios workers. "
+        "Ante un SIGTERM deja de aceptar conexiones y espera a que terminen "
+        "las subidas en curso hasta --graceful-timeout segundos."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default=settings.SERVE_HOST)
+        parser.add_argument("--port", type=int, default=settings.SERVE_PORT)
+        parser.add_argument(
+            "--workers", type=int, default=settings.SERVE_WORKERS,
+            help="Número de procesos. 0 = según los núcleos disponibles.")
+        parser.add_argument(
+            "--keep-alive", type=int, default=settings.SERVE_KEEP_ALIVE,
+            help="Segundos que se mantiene abierta una conexión inactiva.")
+        parser.add_argument(
+            "--graceful-timeout", type=int, default=settings.SERVE_GRACEFUL_TIMEOUT,
+            help="Segundos que se esperan las subidas en curso tras un SIGTERM.")
+
+    def handle(self, *args, **options):
+        workers = options["workers"] or default_worker_count()
+        self.stdout.write(
+            f"Iniciando servidor | host={options['host']} | port={options['port']} | "
+            f"workers={workers} | graceful_timeout={options['graceful_timeout']}")
+
+        # Con más de un worker uvicorn necesita la ruta de importación: cada
+        # proceso hijo carga la aplicación por su cuenta. Las señales las
+        # recibe el proceso supervisor, que las reenvía a los workers y espera
+        # a que cada uno termine su apagado ordenado.
+        config = uvicorn.Config(
+            "video_upload.asgi:application",
+            host=options["host"],
+            port=options["port"],
+            workers=workers,
+            lifespan="off",
+            proxy_headers=True,
+            timeout_keep_alive=options["keep_alive"],
+            timeout_graceful_shutdown=options["graceful_timeout"],
+        )
+        server = uvicorn.Server(config)
+
+        if workers > 1:
+            sock = config.bind_socket()
+            DrainingMultiprocess(config, target=server.run, sockets=[sock]).run()
+        else:
+            server.run()
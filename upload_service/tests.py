@@ -0,0 +1,144 @@
+import os
+import socket
+import tempfile
+from unittest import mock
+
+import uvicorn
+from django.test import SimpleTestCase
+
+from upload_service.management.commands import serve
+from upload_service.utils import RequestSizeLimitMiddleware
+
+
+class RecordingApp:
+    """App ASGI mínima que consume el cuerpo completo y responde 200."""
+
+    def __init__(self):
+        self.called = False
+        self.received = []
+
+    async def __call__(self, scope, receive, send):
+        self.called = True
+        while True:
+            message = await receive()
+            self.received.append(message)
+            if message["type"] == "http.disconnect" or not message.get("more_body"):
+                break
+        if self.received[-1]["type"] == "http.disconnect":
+            return
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def call_middleware(app, headers, messages, max_body_size=10):
+    pending = iter(messages)
+    sent = []
+
+    async def receive():
+        return next(pending)
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = RequestSizeLimitMiddleware(app, max_body_size)
+    await middleware({"type": "http", "path": "/api/upload/", "headers": headers}, receive, send)
+    return sent
+
+
+class RequestSizeLimitMiddlewareTests(SimpleTestCase):
+    async def test_declared_content_length_over_limit_returns_413(self):
+        app = RecordingApp()
+        sent = await call_middleware(app, [(b"content-length", b"11")], [])
+
+        self.assertFalse(app.called)
+        self.assertEqual(sent[0]["status"], 413)
+
+    async def test_invalid_content_length_returns_400(self):
+        app = RecordingApp()
+        sent = await call_middleware(app, [(b"content-length", b"abc")], [])
+
+        self.assertFalse(app.called)
+        self.assertEqual(sent[0]["status"], 400)
+
+    async def test_request_under_limit_passes_through(self):
+        app = RecordingApp()
+        body = {"type": "http.request", "body": b"12345", "more_body": False}
+        sent = await call_middleware(app, [(b"content-length", b"5")], [body])
+
+        self.assertEqual(app.received, [body])
+        self.assertEqual(sent[0]["status"], 200)
+
+    async def test_chunked_body_over_limit_is_cut_with_413(self):
+        app = RecordingApp()
+        sent = await call_middleware(app, [], [
+            {"type": "http.request", "body": b"x" * 8, "more_body": True},
+            {"type": "http.request", "body": b"x" * 8, "more_body": True},
+        ])
+
+        self.assertEqual(app.received[-1], {"type": "http.disconnect"})
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(sent[0]["status"], 413)
+
+
+class DefaultWorkerCountTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cpu_max = os.path.join(self.tmp.name, "cpu.max")
+        self.cfs_quota = os.path.join(self.tmp.name, "cpu.cfs_quota_us")
+        self.cfs_period = os.path.join(self.tmp.name, "cpu.cfs_period_us")
+        for name, value in (
+            ("CGROUP_V2_CPU_MAX", self.cpu_max),
+            ("CGROUP_V1_CPU_QUOTA", self.cfs_quota),
+            ("CGROUP_V1_CPU_PERIOD", self.cfs_period),
+        ):
+            patcher = mock.patch.object(serve, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(serve.os, "process_cpu_count", return_value=8)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, path, content):
+        with open(path, "w") as f:
+            f.write(content)
+
+    def test_cgroup_v2_without_quota_uses_cpu_count(self):
+        self.write(self.cpu_max, "max 100000\n")
+        self.assertEqual(serve.default_worker_count(), 8)
+
+    def test_cgroup_v2_quota_is_rounded_up(self):
+        self.write(self.cpu_max, "150000 100000\n")
+        self.assertEqual(serve.default_worker_count(), 2)
+
+    def test_missing_cgroup_files_use_cpu_count(self):
+        self.assertEqual(serve.default_worker_count(), 8)
+
+    def test_cgroup_v1_quota_is_used_when_v2_is_missing(self):
+        self.write(self.cfs_quota, "300000\n")
+        self.write(self.cfs_period, "100000\n")
+        self.assertEqual(serve.default_worker_count(), 3)
+
+    def test_cgroup_v1_without_quota_uses_cpu_count(self):
+        self.write(self.cfs_quota, "-1\n")
+        self.write(self.cfs_period, "100000\n")
+        self.assertEqual(serve.default_worker_count(), 8)
+
+
+class DrainingMultiprocessTests(SimpleTestCase):
+    def test_sigterm_closes_listening_socket(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        address = sock.getsockname()
+
+        config = uvicorn.Config("video_upload.asgi:application", workers=2)
+        # El supervisor instala manejadores de señales al construirse.
+        with mock.patch("uvicorn.supervisors.multiprocess.signal.signal"):
+            supervisor = serve.DrainingMultiprocess(config, target=lambda sockets: None, sockets=[sock])
+
+        supervisor.handle_term()
+
+        self.assertTrue(supervisor.should_exit.is_set())
+        with self.assertRaises(ConnectionRefusedError):
+            socket.create_connection(address, timeout=1).close()
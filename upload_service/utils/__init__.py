@@ -1,3 +1,4 @@
 from .format_serializer import format_serializer_errors
 from .responses import success_response, error_response, pagination_response
-from .timeout import calculate_upload_timeout
\ No newline at end of file
+from .timeout import calculate_upload_timeout
+from .request_limit import RequestSizeLimitMiddleware
\ No newline at end of file
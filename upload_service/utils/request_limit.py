@@ -0,0 +1,77 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Middleware ASGI que rechaza peticiones cuyo cuerpo supera ``max_body_size``.
+
+    Django lee el cuerpo completo antes de ejecutar sus propios middlewares,
+    por lo que el límite se aplica a nivel ASGI: así no se reciben varios GB
+    que después el serializer rechazaría igualmente.
+    """
+
+    def __init__(self, app, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None:
+            try:
+                declared_size = int(content_length)
+            except ValueError:
+                return await self._reject(send, 400, "Cabecera Content-Length inválida.")
+            if declared_size > self.max_body_size:
+                logger.warning("Petición rechazada por tamaño | path=%s | content_length=%s | max=%s",
+                               scope.get("path"), declared_size, self.max_body_size)
+                return await self._reject(
+                    send, 413, "El cuerpo de la petición supera el tamaño máximo permitido.")
+
+        received = 0
+        response_started = False
+
+        async def tracked_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        async def limited_receive():
+            # Cuerpos sin Content-Length (chunked): al superar el límite se
+            # responde 413 y se simula una desconexión del cliente para que
+            # Django aborte la lectura sin enviar otra respuesta.
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    logger.warning("Petición cortada por tamaño | path=%s | max=%s",
+                                   scope.get("path"), self.max_body_size)
+                    if not response_started:
+                        await self._reject(
+                            tracked_send, 413,
+                            "El cuerpo de la petición supera el tamaño máximo permitido.")
+                    return {"type": "http.disconnect"}
+            return message
+
+        return await self.app(scope, limited_receive, tracked_send)
+
+    @staticmethod
+    async def _reject(send, status: int, message: str):
+        body = json.dumps({"error": message, "data": None, "status": status}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -14,3 +14,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'video_upload.settings')
 
 application = get_asgi_application()
+
+# Importado tras inicializar Django para que la configuración esté cargada.
+from django.conf import settings  # noqa: E402
+from upload_service.utils import RequestSizeLimitMiddleware  # noqa: E402
+
+application = RequestSizeLimitMiddleware(application, settings.MAX_UPLOAD_REQUEST_SIZE)
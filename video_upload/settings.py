@@ -113,6 +113,25 @@ TEMPLATES = [
 WSGI_APPLICATION = 'video_upload.wsgi.application'
 
 
+# Servidor ASGI de producción (python manage.py serve)
+
+SERVE_HOST = config('SERVE_HOST', default='0.0.0.0')
+SERVE_PORT = config('SERVE_PORT', default=8050, cast=int)
+# 0 = calcular a partir de los núcleos disponibles para el contenedor.
+SERVE_WORKERS = config('SERVE_WORKERS', default=0, cast=int)
+# Segundos que una conexión inactiva se mantiene abierta entre peticiones;
+# debe superar el idle timeout del balanceador que haya delante.
+SERVE_KEEP_ALIVE = config('SERVE_KEEP_ALIVE', default=75, cast=int)
+# Plazo máximo (segundos) para que las subidas en curso terminen tras un
+# SIGTERM. El grace period del orquestador debe ser mayor que este valor.
+SERVE_GRACEFUL_TIMEOUT = config('SERVE_GRACEFUL_TIMEOUT', default=3600, cast=int)
+
+# Tamaño máximo del cuerpo de una petición: 5 GB de video más margen para
+# los campos y límites del multipart.
+MAX_UPLOAD_REQUEST_SIZE = config(
+    'MAX_UPLOAD_REQUEST_SIZE', default=5 * 1024 * 1024 * 1024 + 10 * 1024 * 1024, cast=int)
+
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 